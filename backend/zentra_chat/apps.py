@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ZentraChatConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'zentra_chat'
+
+    def ready(self):
+        from . import signals  # noqa: F401
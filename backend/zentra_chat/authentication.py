@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.db import router
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+USER_CACHE_TIMEOUT = 60
+
+# Only the fields authentication and permission checks read. Everything
+# else, the password hash included, stays out of the cache and is deferred:
+# it's loaded from the database if a view touches it.
+CACHED_USER_FIELDS = {"id", "username", "is_active", "is_staff", "is_superuser"}
+
+
+def user_cache_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+def user_version_key(user_id):
+    return f"auth:user-version:{user_id}"
+
+
+def invalidate_cached_user(user_id):
+    """
+    Drop the cached entry for `user_id`, the token's USER_ID_FIELD value.
+
+    Bumping the version also discards an entry written back by a request
+    that read the user from the database before this change was saved.
+    """
+    version_key = user_version_key(user_id)
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        cache.add(version_key, 1, timeout=None)
+    cache.delete(user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that caches the token's user, so authenticated
+    requests don't each issue a SELECT on the user table.
+
+    Cached entries are dropped whenever the user is saved or deleted, and
+    again when the surrounding transaction commits. Writes that skip model
+    signals, such as `QuerySet.update(is_active=False)`, don't invalidate:
+    call `invalidate_cached_user()` for each affected user, or the old
+    entry is served for up to USER_CACHE_TIMEOUT seconds.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        # Revocation is checked against the current password hash, so it
+        # must always go through the database.
+        if user_id is None or api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        key, version_key = user_cache_key(user_id), user_version_key(user_id)
+        cached = cache.get_many([key, version_key])
+        version = cached.get(version_key, 0)
+        entry = cached.get(key)
+        if entry is not None and entry[0] == version:
+            return self.user_model.from_db(
+                router.db_for_read(self.user_model), CACHED_USER_FIELDS, entry[1]
+            )
+
+        user = super().get_user(validated_token)
+        values = [
+            getattr(user, field.attname)
+            for field in self.user_model._meta.concrete_fields
+            if field.attname in CACHED_USER_FIELDS
+        ]
+        # Tagged with the version read before the database lookup, so a
+        # save that lands in between makes this entry stale on arrival.
+        cache.set(key, (version, values), USER_CACHE_TIMEOUT)
+        return user
@@ -0,0 +1,45 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renderer which serializes to JSON with orjson, falling back to DRF's
+    encoder for types orjson doesn't handle natively (lazy strings, Decimal,
+    timedelta, ...).
+
+    Output is JSON equivalent to JSONRenderer's, not byte-for-byte identical:
+    float formatting differs (`1e16` vs `1e+16`), NaN and Infinity render as
+    `null` regardless of STRICT_JSON, and orjson accepts some values
+    JSONRenderer rejects (Enum members, date keys).
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        # orjson only writes compact, non-ASCII-escaped JSON; pretty-printed
+        # or ASCII-only output (e.g. the browsable API) goes to JSONRenderer.
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=ORJSON_OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; let JSONRenderer render them
+            # or raise the error it would have raised.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Keep the output a strict JavaScript subset, as JSONRenderer does.
+        return ret.replace(
+            '\u2028'.encode(), b'\\u2028'
+        ).replace('\u2029'.encode(), b'\\u2029')
@@ -0,0 +1,22 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.settings import api_settings
+
+from .authentication import invalidate_cached_user
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user_on_change(sender, instance, using, **kwargs):
+    # Tokens carry USER_ID_FIELD, which is what the cache is keyed on.
+    user_id = getattr(instance, api_settings.USER_ID_FIELD)
+    invalidate_cached_user(user_id)
+    # Inside a transaction (e.g. the admin change form), another request can
+    # still read the old row and cache it under the new version until the
+    # commit, so invalidate again once the change is visible.
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(partial(invalidate_cached_user, user_id), using=using)
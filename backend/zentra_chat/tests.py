@@ -1,3 +1,177 @@
-from django.test import TestCase
+import datetime
+import json
+import timeit
+from decimal import Decimal
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .authentication import CachedJWTAuthentication, user_cache_key, user_version_key
+from .renderers import ORJSONRenderer
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+class WhoAmIView(APIView):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response({"username": request.user.username})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="alice", email="alice@example.com", password="password123"
+        )
+        self.token = str(AccessToken.for_user(self.user))
+        self.factory = APIRequestFactory()
+
+    def get(self):
+        request = self.factory.get("/", HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        return WhoAmIView.as_view()(request)
+
+    def test_second_request_is_served_from_cache(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get().status_code, 200)
+        with self.assertNumQueries(0):
+            response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {"username": "alice"})
+
+    def test_cache_entry_excludes_password(self):
+        self.get()
+        version, values = cache.get(user_cache_key(self.user.pk))
+        self.assertNotIn(self.user.password, values)
+
+    def test_cached_user_loads_deferred_fields_on_access(self):
+        self.get()
+        request = self.factory.get("/", HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        user, _ = CachedJWTAuthentication().authenticate(request)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, "alice@example.com")
+
+    def test_save_drops_cache_entry(self):
+        self.get()
+        self.user.email = "alice@example.org"
+        self.user.save()
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+        with self.assertNumQueries(1):
+            self.get()
+
+    def test_delete_drops_cache_entry(self):
+        self.get()
+        self.user.delete()
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+        self.assertEqual(self.get().status_code, 401)
+
+    def test_deactivated_user_is_rejected(self):
+        self.get()
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.get().status_code, 401)
+
+    def test_entry_written_before_invalidation_is_ignored(self):
+        self.get()
+        stale = cache.get(user_cache_key(self.user.pk))
+        self.user.is_active = False
+        self.user.save()
+        # A request that read the user before the save writes it back after.
+        cache.set(user_cache_key(self.user.pk), stale)
+        self.assertEqual(self.get().status_code, 401)
+
+    def test_save_inside_transaction_invalidates_on_commit(self):
+        self.get()
+        _, values = cache.get(user_cache_key(self.user.pk))
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.user.is_active = False
+                self.user.save()
+                # Before the commit, a concurrent request still reads the old,
+                # active row and caches it under the bumped version.
+                version = cache.get(user_version_key(self.user.pk))
+                cache.set(user_cache_key(self.user.pk), (version, values))
+        self.assertEqual(self.get().status_code, 401)
+
+
+def paginated_page(rows=50):
+    """A page shaped like PageNumberPagination's response for a user list."""
+    return {
+        "count": 5000,
+        "next": "http://testserver/api/users/?page=2",
+        "previous": None,
+        "results": [
+            {
+                "id": i,
+                "username": f"user{i}",
+                "email": f"user{i}@example.com",
+                "last_login": None,
+                "date_joined": "2024-01-02T03:04:05.123456Z",
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+class ORJSONRendererTests(TestCase):
+    def assertEquivalentToJSONRenderer(self, data, accepted_media_type=None):
+        self.assertEqual(
+            json.loads(ORJSONRenderer().render(data, accepted_media_type)),
+            json.loads(JSONRenderer().render(data, accepted_media_type)),
+        )
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+    def test_lazy_string(self):
+        self.assertEquivalentToJSONRenderer({"detail": _("Not found.")})
+
+    def test_decimal(self):
+        self.assertEquivalentToJSONRenderer({"amount": Decimal("1.50")})
+
+    def test_utc_datetime_uses_z(self):
+        data = {"at": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)}
+        self.assertEqual(ORJSONRenderer().render(data), b'{"at":"2024-01-02T03:04:05Z"}')
+
+    def test_indent(self):
+        self.assertEqual(
+            ORJSONRenderer().render({"a": [1, 2]}, "application/json; indent=4"),
+            JSONRenderer().render({"a": [1, 2]}, "application/json; indent=4"),
+        )
+
+    def test_line_separators_are_escaped(self):
+        self.assertEqual(
+            ORJSONRenderer().render({"text": "caf\u00e9 \u2028 \u2029"}),
+            '{"text":"caf\u00e9 \\u2028 \\u2029"}'.encode(),
+        )
+
+    def test_non_finite_float_renders_null(self):
+        self.assertEqual(ORJSONRenderer().render({"value": float("nan")}), b'{"value":null}')
+
+    def test_integer_wider_than_64_bits(self):
+        self.assertEquivalentToJSONRenderer({"big": 2**70})
+
+    def test_paginated_page_renders_faster_than_json_renderer(self):
+        data = paginated_page()
+        self.assertEquivalentToJSONRenderer(data)
+        orjson_time = min(
+            timeit.repeat(lambda: ORJSONRenderer().render(data), number=200, repeat=5)
+        )
+        json_time = min(
+            timeit.repeat(lambda: JSONRenderer().render(data), number=200, repeat=5)
+        )
+        self.assertLess(orjson_time, json_time)